@@ -1,12 +1,17 @@
-import sys, os, time, subprocess, shlex
+import sys, os, time, subprocess, shlex, functools
+from collections import OrderedDict
 from pathlib import Path
-from configparser import ConfigParser
-from typing import Optional
+from typing import Iterable, Optional
 
-from PySide6.QtCore import Qt, QTimer, QSize
-from PySide6.QtGui import QIcon, QFont, QAction
+from PySide6.QtCore import (
+    Qt, QTimer, QSize, QRect, QAbstractListModel, QModelIndex, QSortFilterProxyModel,
+    QThreadPool, Signal
+)
+from PySide6.QtGui import (
+    QIcon, QFont, QFontMetrics, QAction, QPixmap, QPainter, QColor, QPen, QPalette
+)
 from PySide6.QtWidgets import (
-    QApplication, QWidget, QVBoxLayout, QHBoxLayout, QListWidget, QListWidgetItem,
+    QApplication, QWidget, QVBoxLayout, QHBoxLayout, QListView, QStyledItemDelegate, QStyle,
     QLabel, QLineEdit, QStackedWidget, QToolBar, QMessageBox, QSplitter
 )
 
@@ -30,6 +35,22 @@ APP_DIR = get_app_dir()
 ASSETS_DIR = APP_DIR / "assets"
 INI_PATH = APP_DIR / "projects.ini"
 
+def _find_app_icon() -> Optional[str]:
+    # Windows: preferir .ico para la barra de título
+    for rel in ("assets/app.ico", "assets/app.png"):
+        p = resource_path(rel)
+        if os.path.exists(p):
+            return p
+    return None
+
+# los assets no cambian en vida del proceso: se buscan una sola vez
+APP_ICON_PATH = _find_app_icon()
+
+# QIcon compartido: el .ico se decodifica una vez aunque haya varias ventanas
+@functools.lru_cache(maxsize=None)
+def _build_app_icon() -> Optional[QIcon]:
+    return QIcon(APP_ICON_PATH) if APP_ICON_PATH else None
+
 
 # ----------------- Modelo -----------------
 class Project:
@@ -39,45 +60,238 @@ class Project:
         self.exe = exe
         self.args = args or ""
         self.icon = icon or ""
+        # texto de búsqueda en minúsculas, calculado una vez
+        self.search_key = f"{self.title} {self.desc}".lower()
+        # argv parseado una vez; cada lanzamiento lo reutiliza tal cual
+        self.args_list = shlex.split(self.args, posix=False) if self.args else []
+        self.cwd = os.path.dirname(exe) or None
 
 
 # ----------------- Embedding (solo Windows) -----------------
-if IS_WINDOWS:
-    import win32gui, win32con, win32process
-
-    def find_main_window_for_pid(pid: int, timeout_s: float = 5.0):
-        end = time.time() + timeout_s
-        found_hwnd = None
-
-        def callback(hwnd, _):
-            nonlocal found_hwnd
-            if not win32gui.IsWindowVisible(hwnd):
-                return True
-            _, wpid = win32process.GetWindowThreadProcessId(hwnd)
-            if wpid == pid:
-                style = win32gui.GetWindowLong(hwnd, win32con.GWL_STYLE)
-                if style & win32con.WS_OVERLAPPEDWINDOW or style & win32con.WS_CAPTION:
-                    found_hwnd = hwnd
-                    return False
-            return True
+_SPAWN_KWARGS: dict = {}
 
-        while time.time() < end and not found_hwnd:
-            win32gui.EnumWindows(callback, None)
-            if found_hwnd:
-                break
-            time.sleep(0.1)
-        return found_hwnd
+if IS_WINDOWS:
+    import ctypes
+    from ctypes import wintypes
+
+    WS_OVERLAPPEDWINDOW = 0x00CF0000
+    WS_CAPTION = 0x00C00000
+    WS_SYSMENU = 0x00080000
+    WS_THICKFRAME = 0x00040000
+    WS_MINIMIZEBOX = 0x00020000
+    WS_MAXIMIZEBOX = 0x00010000
+
+    SW_SHOWNOACTIVATE = 4
+
+    # STARTUPINFO compartido para todos los lanzamientos (Popen lo copia):
+    # la ventana del hijo aparece sin robar el foco antes de ser embebida
+    _SPAWN_STARTUPINFO = subprocess.STARTUPINFO()
+    _SPAWN_STARTUPINFO.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+    _SPAWN_STARTUPINFO.wShowWindow = SW_SHOWNOACTIVATE
+    _SPAWN_KWARGS = {"startupinfo": _SPAWN_STARTUPINFO}
+
+    SWP_NOZORDER = 0x0004
+    SWP_NOACTIVATE = 0x0010
+    SWP_FRAMECHANGED = 0x0020
+    SWP_NOCOPYBITS = 0x0100
+    SWP_NOSENDCHANGING = 0x0400
+    SWP_ASYNCWINDOWPOS = 0x4000
+
+    # el hijo es otro proceso: ASYNCWINDOWPOS evita esperar a que procese el mensaje
+    _EMBED_SWP_FLAGS = (SWP_NOZORDER | SWP_NOACTIVATE | SWP_NOCOPYBITS |
+                        SWP_NOSENDCHANGING | SWP_ASYNCWINDOWPOS)
+
+    EVENT_OBJECT_CREATE = 0x8000
+    EVENT_OBJECT_SHOW = 0x8002
+    WINEVENT_OUTOFCONTEXT = 0x0000
+    OBJID_WINDOW = 0
+    CHILDID_SELF = 0
+    GA_ROOT = 2
+    GW_OWNER = 4
+    GWL_STYLE = -16
+    WM_CLOSE = 0x0010
+    SMTO_ABORTIFHUNG = 0x0002
+    ERROR_TIMEOUT = 1460
+    TH32CS_SNAPTHREAD = 0x00000004
+
+    # basta con tener alguno de estos bits para considerarla ventana principal
+    _MAIN_WINDOW_MASK = WS_OVERLAPPEDWINDOW | WS_CAPTION
+
+    # bits de marco que se quitan a la ventana hija al embeberla
+    _EMBED_STRIP_STYLE = (WS_CAPTION | WS_THICKFRAME |
+                          WS_MINIMIZEBOX | WS_MAXIMIZEBOX | WS_SYSMENU)
+
+    class THREADENTRY32(ctypes.Structure):
+        _fields_ = [
+            ("dwSize", wintypes.DWORD),
+            ("cntUsage", wintypes.DWORD),
+            ("th32ThreadID", wintypes.DWORD),
+            ("th32OwnerProcessID", wintypes.DWORD),
+            ("tpBasePri", wintypes.LONG),
+            ("tpDeltaPri", wintypes.LONG),
+            ("dwFlags", wintypes.DWORD),
+        ]
+
+    WNDENUMPROC = ctypes.WINFUNCTYPE(wintypes.BOOL, wintypes.HWND, wintypes.LPARAM)
+
+    WinEventProc = ctypes.WINFUNCTYPE(
+        None, wintypes.HANDLE, wintypes.DWORD, wintypes.HWND,
+        wintypes.LONG, wintypes.LONG, wintypes.DWORD, wintypes.DWORD,
+    )
+
+    _user32 = ctypes.WinDLL("user32", use_last_error=True)
+    _user32.SetWinEventHook.argtypes = [
+        wintypes.DWORD, wintypes.DWORD, wintypes.HMODULE, WinEventProc,
+        wintypes.DWORD, wintypes.DWORD, wintypes.DWORD,
+    ]
+    _user32.SetWinEventHook.restype = wintypes.HANDLE
+    _user32.UnhookWinEvent.argtypes = [wintypes.HANDLE]
+    _user32.UnhookWinEvent.restype = wintypes.BOOL
+    _user32.GetAncestor.argtypes = [wintypes.HWND, wintypes.UINT]
+    _user32.GetAncestor.restype = wintypes.HWND
+    _user32.EnumThreadWindows.argtypes = [wintypes.DWORD, WNDENUMPROC, wintypes.LPARAM]
+    _user32.EnumThreadWindows.restype = wintypes.BOOL
+    _user32.EnumWindows.argtypes = [WNDENUMPROC, wintypes.LPARAM]
+    _user32.EnumWindows.restype = wintypes.BOOL
+    _user32.IsWindowVisible.argtypes = [wintypes.HWND]
+    _user32.IsWindowVisible.restype = wintypes.BOOL
+    _user32.GetWindow.argtypes = [wintypes.HWND, wintypes.UINT]
+    _user32.GetWindow.restype = wintypes.HWND
+    _user32.GetWindowThreadProcessId.argtypes = [wintypes.HWND, ctypes.POINTER(wintypes.DWORD)]
+    _user32.GetWindowThreadProcessId.restype = wintypes.DWORD
+    _user32.GetWindowLongW.argtypes = [wintypes.HWND, ctypes.c_int]
+    _user32.GetWindowLongW.restype = wintypes.LONG
+    _user32.SetWindowLongW.argtypes = [wintypes.HWND, ctypes.c_int, wintypes.LONG]
+    _user32.SetWindowLongW.restype = wintypes.LONG
+    _user32.SetParent.argtypes = [wintypes.HWND, wintypes.HWND]
+    _user32.SetParent.restype = wintypes.HWND
+    _user32.SetWindowPos.argtypes = [
+        wintypes.HWND, wintypes.HWND, ctypes.c_int, ctypes.c_int,
+        ctypes.c_int, ctypes.c_int, wintypes.UINT,
+    ]
+    _user32.SetWindowPos.restype = wintypes.BOOL
+    _user32.SendMessageTimeoutW.argtypes = [
+        wintypes.HWND, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM,
+        wintypes.UINT, wintypes.UINT, ctypes.POINTER(ctypes.c_size_t),
+    ]
+    _user32.SendMessageTimeoutW.restype = wintypes.LPARAM
+    _user32.IsHungAppWindow.argtypes = [wintypes.HWND]
+    _user32.IsHungAppWindow.restype = wintypes.BOOL
+
+    # funciones ya resueltas: el callback se llama una vez por ventana enumerada
+    _IsWindowVisible = _user32.IsWindowVisible
+    _GetWindow = _user32.GetWindow
+    _GetWindowThreadProcessId = _user32.GetWindowThreadProcessId
+    _GetWindowLong = _user32.GetWindowLongW
+
+    _kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    _kernel32.CreateToolhelp32Snapshot.argtypes = [wintypes.DWORD, wintypes.DWORD]
+    _kernel32.CreateToolhelp32Snapshot.restype = wintypes.HANDLE
+    _kernel32.Thread32First.argtypes = [wintypes.HANDLE, ctypes.POINTER(THREADENTRY32)]
+    _kernel32.Thread32First.restype = wintypes.BOOL
+    _kernel32.Thread32Next.argtypes = [wintypes.HANDLE, ctypes.POINTER(THREADENTRY32)]
+    _kernel32.Thread32Next.restype = wintypes.BOOL
+    _kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+    _kernel32.CloseHandle.restype = wintypes.BOOL
+    _INVALID_HANDLE_VALUE = wintypes.HANDLE(-1).value
+
+    def threads_of_pid(pid: int) -> list[int]:
+        snap = _kernel32.CreateToolhelp32Snapshot(TH32CS_SNAPTHREAD, 0)
+        if not snap or snap == _INVALID_HANDLE_VALUE:
+            return []
+        tids = []
+        try:
+            entry = THREADENTRY32()
+            entry.dwSize = ctypes.sizeof(THREADENTRY32)
+            ok = _kernel32.Thread32First(snap, ctypes.byref(entry))
+            while ok:
+                if entry.th32OwnerProcessID == pid:
+                    tids.append(entry.th32ThreadID)
+                ok = _kernel32.Thread32Next(snap, ctypes.byref(entry))
+        finally:
+            _kernel32.CloseHandle(snap)
+        return tids
+
+    def _set_window_style(hwnd, style: int):
+        # 0 es un estilo previo válido: el error se distingue por GetLastError
+        ctypes.set_last_error(0)
+        if not _user32.SetWindowLongW(hwnd, GWL_STYLE, style) and ctypes.get_last_error():
+            raise ctypes.WinError(ctypes.get_last_error())
+
+    def _set_parent(hwnd, parent):
+        ctypes.set_last_error(0)
+        if not _user32.SetParent(hwnd, parent) and ctypes.get_last_error():
+            raise ctypes.WinError(ctypes.get_last_error())
+
+    def is_main_window_of(hwnd, pid: int) -> bool:
+        if not _IsWindowVisible(hwnd):
+            return False
+        # ventanas con dueño (diálogos, splash) no son la principal
+        if _GetWindow(hwnd, GW_OWNER):
+            return False
+        wpid = wintypes.DWORD()
+        _GetWindowThreadProcessId(hwnd, ctypes.byref(wpid))
+        if wpid.value != pid:
+            return False
+        return bool(_GetWindowLong(hwnd, GWL_STYLE) & _MAIN_WINDOW_MASK)
+
+    class _FindCtx(ctypes.Structure):
+        _fields_ = [("pid", wintypes.DWORD), ("hwnd", wintypes.HWND)]
+
+    @WNDENUMPROC
+    def _find_main_window_cb(hwnd, lparam):
+        # el PID llega por lParam: un único callback para todas las búsquedas
+        ctx = ctypes.cast(lparam, ctypes.POINTER(_FindCtx)).contents
+        if is_main_window_of(hwnd, ctx.pid):
+            ctx.hwnd = hwnd
+            return False
+        return True
+
+    def find_main_window_for_pid(pid: int, global_scan: bool = False):
+        # una sola pasada, sin esperas: el reintento lo programa quien llama
+        ctx = _FindCtx(pid, None)
+        lparam = ctypes.addressof(ctx)
+
+        # solo las ventanas de los hilos del hijo, no todas las del escritorio
+        for tid in threads_of_pid(pid):
+            _user32.EnumThreadWindows(tid, _find_main_window_cb, lparam)
+            if ctx.hwnd:
+                return ctx.hwnd
+        if global_scan:
+            _user32.EnumWindows(_find_main_window_cb, lparam)
+        return ctx.hwnd
+
+
+def reap_process(proc: subprocess.Popen, timeout_s: float = 2.0):
+    # corre en el pool: espera al hijo sin bloquear la UI y lo mata si no sale
+    try:
+        proc.wait(timeout=timeout_s)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
 
 
 class EmbeddedAppWidget(QWidget):
-    def __init__(self, exe_path: str, args: str):
+    # (proc, error) emitido desde el hilo del pool que hizo el Popen
+    _spawned = Signal(object, object)
+
+    def __init__(self, project: Project):
         super().__init__()
-        self.exe_path = exe_path
-        self.args = args or ""
+        self.project = project
+        self.exe_path = project.exe
         self.proc = None
         self.hwnd = None
+        self._closing = False
+        self._hook = None
+        self._poll_timer: Optional[QTimer] = None
         self.setMinimumSize(QSize(300, 200))
 
+        # al arrastrar el borde llegan decenas de resizeEvent: uno por frame basta
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(16)
+        self._resize_timer.timeout.connect(self._resize_embedded)
+
         lay = QVBoxLayout(self)
         self.info = QLabel("Cargando aplicación…", alignment=Qt.AlignCenter)
         self.info.setWordWrap(True)
@@ -91,75 +305,188 @@ class EmbeddedAppWidget(QWidget):
         self._launch_and_embed()
 
     def _launch_external(self):
-        try:
-            args_list = shlex.split(self.args, posix=False) if self.args else []
-            subprocess.Popen([self.exe_path, *args_list], shell=False,
-                             cwd=os.path.dirname(self.exe_path) or None)
-            self.info.setText("Aplicación abierta externamente.")
-        except Exception as e:
-            self.info.setText(f"Error lanzando app externa:\n{e}")
+        self._start_process()
 
     def _launch_and_embed(self):
         if not os.path.isfile(self.exe_path):
             self.info.setText(f"No se encontró el ejecutable:\n{self.exe_path}")
             return
+        self._start_process()
+
+    def _start_process(self):
+        # CreateProcess (carga del exe, antivirus) puede tardar cientos de ms:
+        # se hace en el pool para no congelar el hilo de la UI
+        argv = [self.exe_path, *self.project.args_list]
+        cwd = self.project.cwd
+        self._spawned.connect(self._on_spawned)
+        QThreadPool.globalInstance().start(lambda: self._spawn(argv, cwd))
+
+    def _spawn(self, argv: list[str], cwd: Optional[str]):
+        # corre en un hilo del pool
         try:
-            args_list = shlex.split(self.args, posix=False) if self.args else []
-            self.proc = subprocess.Popen([self.exe_path, *args_list], shell=False,
-                                         cwd=os.path.dirname(self.exe_path) or None)
+            # los hijos son apps GUI: sin stdio heredado ni pipes que puedan llenarse
+            proc = subprocess.Popen(argv, shell=False, cwd=cwd,
+                                    stdin=subprocess.DEVNULL,
+                                    stdout=subprocess.DEVNULL,
+                                    stderr=subprocess.DEVNULL,
+                                    **_SPAWN_KWARGS)
         except Exception as e:
-            self.info.setText(f"No se pudo lanzar el proceso:\n{e}")
+            proc, error = None, e
+        else:
+            error = None
+        try:
+            self._spawned.emit(proc, error)
+        except RuntimeError:
+            # el widget se destruyó mientras se lanzaba: no dejar el hijo embebible huérfano
+            if proc and IS_WINDOWS:
+                proc.terminate()
+
+    def _on_spawned(self, proc, error):
+        if not IS_WINDOWS:
+            if error is not None:
+                self.info.setText(f"Error lanzando app externa:\n{error}")
+            else:
+                self.info.setText("Aplicación abierta externamente.")
+            return
+        if error is not None:
+            self.info.setText(f"No se pudo lanzar el proceso:\n{error}")
+            return
+        if self._closing:
+            proc.terminate()
+            return
+        self.proc = proc
+        self._watch_for_window()
+
+    def _watch_for_window(self):
+        # en vez de sondear EnumWindows, Windows nos avisa al crear/mostrar ventanas;
+        # filtrado por PID en origen: solo llegan eventos del hijo
+        self._hook_proc = WinEventProc(self._on_win_event)
+        self._hook = _user32.SetWinEventHook(EVENT_OBJECT_CREATE, EVENT_OBJECT_SHOW, None,
+                                             self._hook_proc, self.proc.pid, 0,
+                                             WINEVENT_OUTOFCONTEXT)
+
+        # la ventana pudo aparecer antes de suscribirnos
+        hwnd = find_main_window_for_pid(self.proc.pid)
+        if hwnd:
+            self._try_embed(hwnd)
             return
 
-        def try_embed():
-            if not IS_WINDOWS or not self.proc:
-                return
-            hwnd = find_main_window_for_pid(self.proc.pid, timeout_s=0.1)
-            if hwnd:
-                self.hwnd = hwnd
+        # red de seguridad por si el hook no ve la ventana: sondeo no bloqueante
+        # con backoff 20 ms -> 40 -> 80 ... tope 500 ms, durante ~5 s
+        self._poll_ticks = 0
+        self._poll_interval = 20
+        self._poll_deadline = time.monotonic() + 5.0
+        self._poll_timer = QTimer(self)
+        self._poll_timer.setSingleShot(True)
+        self._poll_timer.timeout.connect(self._poll_embed)
+        self._poll_timer.start(self._poll_interval)
+
+    def _poll_embed(self):
+        if self.hwnd or not self.proc:
+            return
+        if self.proc.poll() is not None:
+            self._stop_watching()
+            self.info.setText("La aplicación terminó antes de mostrar su ventana.")
+            return
+        self._poll_ticks += 1
+        # tras unos ticks sin éxito, barrido global además de los hilos del hijo
+        hwnd = find_main_window_for_pid(self.proc.pid, global_scan=self._poll_ticks >= 5)
+        if hwnd:
+            self._try_embed(hwnd)
+            return
+        if time.monotonic() >= self._poll_deadline:
+            # se deja de sondear; el hook sigue escuchando para apps lentas y,
+            # si al final embebe, _try_embed oculta este aviso
+            self.info.setText("No se encontró la ventana de la aplicación;\nsigue abierta por fuera.")
+            return
+        self._poll_interval = min(self._poll_interval * 2, 500)
+        self._poll_timer.start(self._poll_interval)
+
+    def _on_win_event(self, hook, event, hwnd, id_object, id_child, thread_id, time_ms):
+        if self.hwnd or not self.proc or not hwnd:
+            return
+        if id_object != OBJID_WINDOW or id_child != CHILDID_SELF:
+            return
+        # descartar controles hijos antes de consultar estilo/PID
+        if _user32.GetAncestor(hwnd, GA_ROOT) != hwnd:
+            return
+        if is_main_window_of(hwnd, self.proc.pid):
+            # no reparentar dentro del callback del hook: se encola al event loop
+            # con self como contexto, la llamada se descarta si el widget se destruye
+            QTimer.singleShot(0, self, lambda: self._try_embed(hwnd))
+
+    def _try_embed(self, hwnd):
+        # un evento encolado justo antes de closeEvent no debe reparentar
+        if self.hwnd or self._closing:
+            return
+        # primero dejar de escuchar: eventos posteriores no deben reintentar
+        # sobre una ventana que se está reestilando
+        self._stop_watching()
+        self.hwnd = hwnd
+        style = None
+        try:
+            style = _GetWindowLong(hwnd, GWL_STYLE)
+            _set_window_style(hwnd, style & ~_EMBED_STRIP_STYLE)
+            _set_parent(hwnd, int(self.winId()))
+            # un solo SetWindowPos recalcula el marco nuevo y coloca/dimensiona
+            self._resize_embedded(SWP_FRAMECHANGED)
+            self.info.setVisible(False)
+        except Exception as e:
+            # sin reintentos: se devuelve el marco y la app queda corriendo por fuera
+            self.hwnd = None
+            if style is not None:
                 try:
-                    style = win32gui.GetWindowLong(hwnd, win32con.GWL_STYLE)
-                    style &= ~(win32con.WS_CAPTION | win32con.WS_THICKFRAME |
-                               win32con.WS_MINIMIZEBOX | win32con.WS_MAXIMIZEBOX | win32con.WS_SYSMENU)
-                    win32gui.SetWindowLong(hwnd, win32con.GWL_STYLE, style)
-                    win32gui.SetParent(hwnd, int(self.winId()))
-                    self._resize_embedded()
-                    self.info.setVisible(False)
-                    timer.stop()
-                except Exception as e:
-                    self.info.setText(f"No se pudo embeber la ventana:\n{e}")
-
-        timer = QTimer(self)
-        timer.timeout.connect(try_embed)
-        timer.start(100)
-
-    def _resize_embedded(self):
+                    _set_window_style(hwnd, style)
+                except Exception:
+                    pass
+            self.info.setText(f"No se pudo embeber la ventana; sigue abierta por fuera:\n{e}")
+            return
+        if self._poll_timer:
+            self._poll_timer.deleteLater()
+            self._poll_timer = None
+
+    def _stop_watching(self):
+        if self._poll_timer:
+            self._poll_timer.stop()
+        if self._hook:
+            _user32.UnhookWinEvent(self._hook)
+            self._hook = None
+
+    def _resize_embedded(self, extra_flags: int = 0):
         if IS_WINDOWS and self.hwnd:
             w, h = max(1, self.width()), max(1, self.height())
-            import win32gui
-            win32gui.MoveWindow(self.hwnd, 0, 0, w, h, True)
+            _user32.SetWindowPos(self.hwnd, None, 0, 0, w, h, _EMBED_SWP_FLAGS | extra_flags)
 
     def resizeEvent(self, e):
         super().resizeEvent(e)
         if IS_WINDOWS and self.hwnd:
-            self._resize_embedded()
+            self._resize_timer.start()
 
     def closeEvent(self, e):
+        self._closing = True
+        self._stop_watching()
+        proc = self.proc
         try:
-            if self.proc and self.proc.poll() is None:
-                self.proc.terminate()
-                for _ in range(20):
-                    if self.proc.poll() is not None:
-                        break
-                    time.sleep(0.1)
-                if self.proc.poll() is None:
-                    self.proc.kill()
+            if proc and proc.poll() is None:
+                if IS_WINDOWS and self.hwnd:
+                    # cierre ordenado (la app puede guardar), acotado a 500 ms
+                    # y sin esperar nada si la ventana está colgada
+                    result = ctypes.c_size_t()
+                    ok = _user32.SendMessageTimeoutW(self.hwnd, WM_CLOSE, 0, 0,
+                                                     SMTO_ABORTIFHUNG, 500, ctypes.byref(result))
+                    err = ctypes.get_last_error()
+                    if not ok and (err != ERROR_TIMEOUT or _user32.IsHungAppWindow(self.hwnd)):
+                        proc.kill()
+                else:
+                    proc.terminate()
+                QThreadPool.globalInstance().start(lambda: reap_process(proc))
         except Exception:
             pass
         super().closeEvent(e)
 
 
-# ----------------- Widget de la lista (tarjeta) -----------------
+# ----------------- Lista de proyectos (modelo + delegate) -----------------
+@functools.lru_cache(maxsize=512)
 def resolve_icon(icon_value: str) -> Optional[str]:
     if not icon_value:
         return None
@@ -168,66 +495,146 @@ def resolve_icon(icon_value: str) -> Optional[str]:
         p = (APP_DIR / icon_value).resolve()
     return str(p) if p.exists() else None
 
-class ProjectListItem(QWidget):
-    def __init__(self, project: Project):
-        super().__init__()
+@functools.lru_cache(maxsize=256)
+def _load_icon_pixmap(path: str) -> Optional[QPixmap]:
+    # decodificar + escalar suave es lo caro por fila: una vez por ruta
+    pix = QPixmap(path)
+    if pix.isNull():
+        return None
+    return pix.scaled(28, 28, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+DESC_ROLE = Qt.UserRole + 1
+
+class ProjectModel(QAbstractListModel):
+    def __init__(self, projects: list[Project], parent=None):
+        super().__init__(parent)
+        self._projects = projects
+        # columnas paralelas: data() y el filtro indexan sin tocar atributos de Project
+        self._titles = tuple(p.title for p in projects)
+        self._descs = tuple(p.desc or "" for p in projects)
+        self._icons = tuple(p.icon for p in projects)
+        self._keys = tuple(p.search_key for p in projects)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._titles)
+
+    def project(self, row: int) -> Project:
+        return self._projects[row]
+
+    def search_key(self, row: int) -> str:
+        return self._keys[row]
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        if role == Qt.DisplayRole:
+            return self._titles[row]
+        if role == DESC_ROLE:
+            return self._descs[row]
+        if role == Qt.DecorationRole:
+            icon_abs = resolve_icon(self._icons[row])
+            return _load_icon_pixmap(icon_abs) if icon_abs else None
+        if role == Qt.UserRole:
+            return row
+        return None
 
-        # --- tarjeta contenedora ---
-        card = QWidget(self)
-        card.setObjectName("card")
-        card_lay = QHBoxLayout(card)
-        card_lay.setContentsMargins(8, 6, 8, 6)
-        card_lay.setSpacing(10)
 
-        # --- icono ---
-        icon_abs = resolve_icon(project.icon)
-        if icon_abs:
-            from PySide6.QtGui import QPixmap
-            icon_lbl = QLabel()
-            pix = QPixmap(icon_abs)
-            if not pix.isNull():
-                icon_lbl.setPixmap(pix.scaled(28, 28, Qt.KeepAspectRatio, Qt.SmoothTransformation))
-            icon_lbl.setFixedSize(32, 32)
-            icon_lbl.setAlignment(Qt.AlignCenter)
-            card_lay.addWidget(icon_lbl)
+class ProjectFilterProxy(QSortFilterProxyModel):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._query = ""
+
+    def set_query(self, q: str):
+        self._query = q
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        if not self._query:
+            return True
+        return self._query in self.sourceModel().search_key(source_row)
+
+
+# colores de la tarjeta, compartidos por todas las filas
+_CARD_BORDER = QColor("#444")
+_CARD_BORDER_HOVER = QColor("#666")
+_CARD_BG_HOVER = QColor(255, 255, 255, 8)
+_DESC_COLOR = QColor("#aaa")
+
+class ProjectDelegate(QStyledItemDelegate):
+    # pinta la tarjeta con QPainter: ningún QWidget por fila
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # QFont necesita la QApplication creada: se construyen aquí, una vez por lista
+        self.title_font = QFont()
+        self.title_font.setPointSize(11)
+        self.title_font.setBold(True)
+        self.desc_font = QFont()
+        self.desc_font.setPointSize(9)
+        self.title_fm = QFontMetrics(self.title_font)
+        self.desc_fm = QFontMetrics(self.desc_font)
+        self.text_h = self.title_fm.height() + 4 + self.desc_fm.height()
+        self.pen_border = QPen(_CARD_BORDER, 1)
+        self.pen_border_hover = QPen(_CARD_BORDER_HOVER, 1)
+
+    def sizeHint(self, option, index):
+        return QSize(option.rect.width(), max(32, self.text_h) + 6 + 6 + 2)
+
+    def paint(self, painter, option, index):
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        # --- tarjeta ---
+        card = option.rect.adjusted(1, 1, -1, -1)
+        hover = bool(option.state & QStyle.State_MouseOver)
+        if option.state & QStyle.State_Selected:
+            painter.setBrush(option.palette.highlight())
+        elif hover:
+            painter.setBrush(_CARD_BG_HOVER)
         else:
-            card_lay.addSpacing(32)
+            painter.setBrush(Qt.NoBrush)
+        painter.setPen(self.pen_border_hover if hover else self.pen_border)
+        painter.drawRoundedRect(card, 8, 8)
+
+        # --- icono ---
+        x = card.left() + 8
+        pix = index.data(Qt.DecorationRole)
+        if pix:
+            painter.drawPixmap(x + (32 - pix.width()) // 2,
+                               card.center().y() - pix.height() // 2, pix)
+        x += 32 + 10
 
         # --- textos ---
-        text_layout = QVBoxLayout()
-        title_lbl = QLabel(project.title)
-        font = QFont()
-        font.setPointSize(11)
-        font.setBold(True)
-        title_lbl.setFont(font)
+        width = max(0, card.right() - 8 - x)
+        title_fm, desc_fm = self.title_fm, self.desc_fm
+        top = card.center().y() - self.text_h // 2
 
-        desc_lbl = QLabel(project.desc or "")
-        desc_lbl.setStyleSheet("color: #aaa; font-size: 9pt;")
+        painter.setFont(self.title_font)
+        painter.setPen(option.palette.color(QPalette.Text))
+        painter.drawText(QRect(x, top, width, title_fm.height()), Qt.AlignLeft | Qt.AlignVCenter,
+                         title_fm.elidedText(index.data(Qt.DisplayRole), Qt.ElideRight, width))
 
-        text_layout.addWidget(title_lbl)
-        text_layout.addWidget(desc_lbl)
-        card_lay.addLayout(text_layout)
+        top += title_fm.height() + 4
+        painter.setFont(self.desc_font)
+        painter.setPen(_DESC_COLOR)
+        painter.drawText(QRect(x, top, width, desc_fm.height()), Qt.AlignLeft | Qt.AlignVCenter,
+                         desc_fm.elidedText(index.data(DESC_ROLE), Qt.ElideRight, width))
 
-        # layout raíz: solo contiene la tarjeta
-        root = QVBoxLayout(self)
-        root.setContentsMargins(0, 0, 0, 0)
-        root.addWidget(card)
-
-        # estilo aplicado SOLO a la tarjeta
-        self.setStyleSheet("""
-            #card {
-                border: 1px solid #444;
-                border-radius: 8px;
-                background: transparent;
-            }
-            #card:hover {
-                border-color: #666;
-                background: rgba(255,255,255,0.03);
-            }
-        """)
+        painter.restore()
 
 
 # ----------------- Home / Project Pages -----------------
+def heading_label(text: str) -> QLabel:
+    # texto plano + fuente en negrita: mismo aspecto que <h2> sin el parser HTML
+    lbl = QLabel(text)
+    lbl.setTextFormat(Qt.PlainText)
+    f = lbl.font()
+    f.setPointSize(f.pointSize() + 4)
+    f.setBold(True)
+    lbl.setFont(f)
+    return lbl
+
+
 class HomePage(QWidget):
     def __init__(self, projects: list[Project], on_open, header_title: str = "Accesos directos"):
         super().__init__()
@@ -238,81 +645,99 @@ class HomePage(QWidget):
         layout = QVBoxLayout(self)
         layout.setContentsMargins(12, 12, 0, 0)
 
-        header = QLabel(f"<h2>{self.header_title}</h2>")
+        header = heading_label(self.header_title)
         layout.addWidget(header)
 
         # Buscador
         search_row = QHBoxLayout()
         self.search = QLineEdit()
         self.search.setPlaceholderText("Buscar por título o descripción…")
-        self.search.textChanged.connect(self._apply_filter)
+        # filtra cuando se deja de teclear, no en cada carácter
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(120)
+        self._filter_timer.timeout.connect(lambda: self._apply_filter(self.search.text()))
+        self.search.textChanged.connect(lambda _text: self._filter_timer.start())
         search_row.addWidget(QLabel("Buscar:"))
         search_row.addWidget(self.search)
         layout.addLayout(search_row)
 
-        # Lista
-        self.listw = QListWidget()
-        self.listw.itemDoubleClicked.connect(self._open_selected)
-        layout.addWidget(self.listw)
-
-        self._populate(self.all_projects)
-
-    def _populate(self, projects: list[Project]):
-        self.listw.clear()
-        for p in projects:
-            item = QListWidgetItem()
-            widget = ProjectListItem(p)
-            item.setSizeHint(widget.sizeHint())
-            item.setData(Qt.UserRole, p)
-            self.listw.addItem(item)
-            self.listw.setItemWidget(item, widget)
+        # Lista: solo se pintan las filas visibles
+        self.model = ProjectModel(self.all_projects, self)
+        self.proxy = ProjectFilterProxy(self)
+        self.proxy.setSourceModel(self.model)
+        self.listv = QListView()
+        self.listv.setModel(self.proxy)
+        self.listv.setItemDelegate(ProjectDelegate(self.listv))
+        self.listv.viewport().setAttribute(Qt.WA_Hover, True)
+        # todas las tarjetas miden lo mismo: Qt no recalcula el tamaño fila a fila
+        self.listv.setUniformItemSizes(True)
+        self.listv.doubleClicked.connect(self._open_index)
+        layout.addWidget(self.listv)
 
     def _apply_filter(self, text: str):
-        q = (text or "").strip().lower()
-        if not q:
-            self._populate(self.all_projects)
-            return
-        filtered = [p for p in self.all_projects if q in f"{p.title} {p.desc}".lower()]
-        self._populate(filtered)
+        self.proxy.set_query((text or "").strip().lower())
 
-    def _open_selected(self):
-        item = self.listw.currentItem()
-        if not item:
-            return
-        p: Project = item.data(Qt.UserRole)
-        self.on_open(p)
+    def _open_index(self, index):
+        row = index.data(Qt.UserRole)
+        if row is not None:
+            self.on_open(self.model.project(row))
 
 
 class ProjectPage(QWidget):
     def __init__(self, project: Project):
         super().__init__()
+        self.project = project
+        self.embed: Optional[EmbeddedAppWidget] = None
+
         layout = QVBoxLayout(self)
-        title = QLabel(f"<h2>{project.title}</h2>")
+        title = heading_label(project.title)
         subtitle = QLabel(project.desc or "")
+        subtitle.setTextFormat(Qt.PlainText)
         layout.addWidget(title)
         layout.addWidget(subtitle)
         self.splitter = QSplitter(Qt.Vertical)
-        self.embed = EmbeddedAppWidget(project.exe, project.args)
-        self.splitter.addWidget(self.embed)
+        # el proceso se lanza tras el primer frame, no en el clic
+        self.placeholder = QLabel("Cargando…", alignment=Qt.AlignCenter)
+        self.splitter.addWidget(self.placeholder)
         layout.addWidget(self.splitter)
 
+    def showEvent(self, e):
+        super().showEvent(e)
+        if self.embed is None:
+            QTimer.singleShot(0, self._build_embed)
+
+    def _build_embed(self):
+        if self.embed is not None:
+            return
+        self.embed = EmbeddedAppWidget(self.project)
+        self.splitter.replaceWidget(0, self.embed)
+        self.placeholder.deleteLater()
+        self.placeholder = None
+
 
 # ----------------- Ventana principal -----------------
+# máximo de proyectos con proceso vivo; el menos usado se cierra al superar el límite
+MAX_LIVE_PAGES = 3
+
+
 class MainWindow(QWidget):
-    def __init__(self, projects: list[Project], header_title: str):
+    def __init__(self, projects: list[Project], header_title: str,
+                 app_icon: Optional[QIcon] = None):
         super().__init__()
         self.setWindowTitle(APP_NAME)
         self.resize(570, 760)
 
-        ico_path = Path(resource_path("assets/app.ico"))
-        png_path = Path(resource_path("assets/app.png"))
-        if ico_path.exists():
-            self.setWindowIcon(QIcon(str(ico_path)))
-        elif png_path.exists():
-            self.setWindowIcon(QIcon(str(png_path)))
+        app_icon = app_icon or _build_app_icon()
+        if app_icon:
+            self.setWindowIcon(app_icon)
 
-        self.back_stack: list[int] = []
-        self.forward_stack: list[int] = []
+        # historial de páginas vivas: volver/avanzar no relanza el ejecutable
+        self.back_stack: list[QWidget] = []
+        self.forward_stack: list[QWidget] = []
+        # páginas vivas por proyecto, de la menos a la más reciente (LRU):
+        # reabrir uno no lanza otro proceso
+        self._pages: OrderedDict[int, ProjectPage] = OrderedDict()
 
         root = QVBoxLayout(self)
 
@@ -321,8 +746,11 @@ class MainWindow(QWidget):
         self.act_forward = QAction("Adelante →", self)
         self.act_back.triggered.connect(self.go_back)
         self.act_forward.triggered.connect(self.go_forward)
+        self.act_close = QAction("Cerrar proyecto", self)
+        self.act_close.triggered.connect(self.close_project)
         toolbar.addAction(self.act_back)
         toolbar.addAction(self.act_forward)
+        toolbar.addAction(self.act_close)
         root.addWidget(toolbar)
 
         self.stack = QStackedWidget()
@@ -339,96 +767,193 @@ class MainWindow(QWidget):
         self._update_nav_buttons()
 
     def open_project(self, project: Project):
-        page = ProjectPage(project)
-        self.stack.addWidget(page)
-        self.back_stack.append(self.stack.currentIndex())
-        self.stack.setCurrentWidget(page)
+        page = self._pages.get(id(project))
+        if page is not None and page is self.stack.currentWidget():
+            return
+        if page is not None:
+            # se mueve a la cima del historial en vez de duplicarla
+            if page in self.back_stack:
+                self.back_stack.remove(page)
+            if page in self.forward_stack:
+                self.forward_stack.remove(page)
+        # abrir desde el medio vacía "adelante", pero esas páginas siguen vivas en
+        # _pages: solo el LRU (o "Cerrar proyecto") termina su proceso
         self.forward_stack.clear()
-        self._update_nav_buttons()
+        if page is None:
+            page = ProjectPage(project)
+            self._pages[id(project)] = page
+            self.stack.addWidget(page)
+        self.back_stack.append(self.stack.currentWidget())
+        self._show_page(page)
 
     def go_back(self):
         if not self.back_stack:
             return
-        current = self.stack.currentIndex()
-        prev = self.back_stack.pop()
-        widget = self.stack.widget(current)
-        self.stack.removeWidget(widget)
-        widget.deleteLater()
-        self.stack.setCurrentIndex(prev)
-        self._update_nav_buttons()
+        self.forward_stack.append(self.stack.currentWidget())
+        self._show_page(self.back_stack.pop())
 
     def go_forward(self):
-        pass
+        if not self.forward_stack:
+            return
+        self.back_stack.append(self.stack.currentWidget())
+        self._show_page(self.forward_stack.pop())
+
+    def _show_page(self, page: QWidget):
+        self.stack.setCurrentWidget(page)
+        if isinstance(page, ProjectPage):
+            self._pages.move_to_end(id(page.project))
+            self._evict_pages()
+        self._update_nav_buttons()
+
+    def _evict_pages(self):
+        # la página visible es siempre la más reciente: nunca se desaloja
+        while len(self._pages) > MAX_LIVE_PAGES:
+            _, old = self._pages.popitem(last=False)
+            self.back_stack = [w for w in self.back_stack if w is not old]
+            self.forward_stack = [w for w in self.forward_stack if w is not old]
+            self._discard_page(old)
+
+    def close_project(self):
+        page = self.stack.currentWidget()
+        if not isinstance(page, ProjectPage):
+            return
+        prev = self.back_stack.pop() if self.back_stack else self.home
+        self.stack.setCurrentWidget(prev)
+        self._discard_page(page)
+        self._update_nav_buttons()
+
+    def _discard_page(self, page: QWidget):
+        if page is self.home:
+            return
+        self.stack.removeWidget(page)
+        if isinstance(page, ProjectPage):
+            self._pages.pop(id(page.project), None)
+        # deleteLater no dispara closeEvent: cerrar el embed termina el proceso
+        if isinstance(page, ProjectPage) and page.embed is not None:
+            page.embed.close()
+        page.deleteLater()
 
     def _update_nav_buttons(self):
         self.act_back.setEnabled(bool(self.back_stack))
-        self.act_forward.setEnabled(False)
+        self.act_forward.setEnabled(bool(self.forward_stack))
+        self.act_close.setEnabled(isinstance(self.stack.currentWidget(), ProjectPage))
+
+    def closeEvent(self, e):
+        for i in range(self.stack.count()):
+            page = self.stack.widget(i)
+            if isinstance(page, ProjectPage) and page.embed is not None:
+                page.embed.close()
+        super().closeEvent(e)
 
 
 # ----------------- Config / Carga de projects.ini -----------------
+# INI de ejemplo: constante de módulo, no se formatea en cada arranque
+_DEFAULT_INI = "\n".join([
+    "[General]",
+    "header_title=Accesos directos",
+    "",
+    "[Proyecto1]",
+    "title=Bloc de notas (ejemplo)",
+    "desc=Ejemplo de app Win32 sencilla embebida.",
+    r"exe=C:\Windows\System32\notepad.exe",
+    "args=",
+    "icon=",
+    "",
+    "[Proyecto2]",
+    "title=Calculadora (ejemplo)",
+    "desc=Según versión puede abrir externo.",
+    r"exe=C:\Windows\System32\calc.exe",
+    "args=",
+    "icon=",
+    "",
+    "[Proyecto3]",
+    "title=Paint (ejemplo)",
+    "desc=Otro ejemplo Win32 clásico.",
+    r"exe=C:\Windows\System32\mspaint.exe",
+    "args=",
+    "icon=",
+    "",
+])
+
 def ensure_projects_ini(ini_path: Path) -> None:
-    if ini_path.exists():
-        return
-    notepad = r"C:\Windows\System32\notepad.exe"
-    calc = r"C:\Windows\System32\calc.exe"
-    mspaint = r"C:\Windows\System32\mspaint.exe"
-    example_ini = f"""[General]
-header_title=Accesos directos
-
-[Proyecto1]
-title=Bloc de notas (ejemplo)
-desc=Ejemplo de app Win32 sencilla embebida.
-exe={notepad}
-args=
-icon=
-
-[Proyecto2]
-title=Calculadora (ejemplo)
-desc=Según versión puede abrir externo.
-exe={calc}
-args=
-icon=
-
-[Proyecto3]
-title=Paint (ejemplo)
-desc=Otro ejemplo Win32 clásico.
-exe={mspaint}
-args=
-icon=
-"""
-    ini_path.write_text(example_ini, encoding="utf-8")
-
-def load_projects_from_ini(ini_path: Path):
-    cfg = ConfigParser()
-    if not ini_path.exists():
-        raise FileNotFoundError(f"No se encontró {ini_path.name}.")
-    cfg.read(ini_path, encoding="utf-8")
-
-    header_title = "Accesos directos"
-    if cfg.has_section("General"):
-        header_title = cfg.get("General", "header_title",
-                               fallback=cfg.get("General", "title", fallback="Accesos directos"))
+    # "x" crea solo si no existe: sin stat previo y sin pisar un INI creado entre medias
+    try:
+        with open(ini_path, "x", encoding="utf-8") as f:
+            f.write(_DEFAULT_INI)
+    except FileExistsError:
+        pass
 
-    projects: list[Project] = []
-    for section in cfg.sections():
-        if section == "General":
+# projects.ini solo usa [Seccion] + clave=valor: una pasada lineal, sin ConfigParser.
+def parse_ini_lines(lines: Iterable[str]) -> dict[str, dict[str, str]]:
+    sections: dict[str, dict[str, str]] = {}
+    current: Optional[dict[str, str]] = None
+    for line in lines:
+        line = line.strip()
+        if not line or line[0] in ";#":
             continue
-        title = cfg.get(section, "title", fallback=section)
-        desc  = cfg.get(section, "desc",  fallback="")
-        exe   = cfg.get(section, "exe",   fallback="")
-        args  = cfg.get(section, "args",  fallback="")
-        icon  = cfg.get(section, "icon",  fallback="")
+        if line[0] == "[" and line[-1] == "]":
+            current = sections.setdefault(line[1:-1].strip(), {})
+            continue
+        key, sep, value = line.partition("=")
+        if sep and current is not None:
+            key = key.strip()
+            if key:
+                current[key.lower()] = value.strip()
+    return sections
+
+# Resultado ya parseado por ruta, válido mientras no cambien mtime/tamaño.
+_INI_CACHE: dict[Path, tuple[int, int, tuple[str, list[Project]]]] = {}
+
+def load_projects_from_ini(ini_path: Path, st: Optional[os.stat_result] = None):
+    # quien ya hizo stat (main) lo pasa y se ahorra la segunda llamada
+    if st is None:
+        try:
+            st = os.stat(ini_path)
+        except FileNotFoundError:
+            _INI_CACHE.pop(ini_path, None)
+            raise FileNotFoundError(f"No se encontró {ini_path.name}.") from None
+
+    cached = _INI_CACHE.get(ini_path)
+    if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+
+    # el INI cambió: las rutas de icono que se resolvieron pueden no valer ya
+    resolve_icon.cache_clear()
+
+    # un único open, leyendo línea a línea sin materializar el archivo
+    with open(ini_path, encoding="utf-8") as f:
+        sections = parse_ini_lines(f)
+
+    # [General] fuera del dict: el resto son todos proyectos
+    general = sections.pop("General", None) or {}
+    header_title = general.get("header_title", general.get("title", "Accesos directos"))
+
+    projects: list[Project] = []
+    for section, values in sections.items():
+        title = values.get("title", section)
+        desc  = values.get("desc",  "")
+        exe   = values.get("exe",   "")
+        args  = values.get("args",  "")
+        icon  = values.get("icon",  "")
         if not exe:
             continue
         projects.append(Project(title, desc, exe, args, icon))
-    return header_title, projects
+
+    result = (header_title, projects)
+    _INI_CACHE[ini_path] = (st.st_mtime_ns, st.st_size, result)
+    return result
 
 
 # ----------------- Tema oscuro -----------------
+_CACHED_QSS: Optional[str] = None
+
 def ensure_dark_theme(app: QApplication):
+    global _CACHED_QSS
     try:
-        import qdarkstyle
-        app.setStyleSheet(qdarkstyle.load_stylesheet(qt_api="pyside6"))
+        if _CACHED_QSS is None:
+            import qdarkstyle
+            _CACHED_QSS = qdarkstyle.load_stylesheet(qt_api="pyside6")
+        app.setStyleSheet(_CACHED_QSS)
     except Exception:
         pass
 
@@ -436,27 +961,30 @@ def ensure_dark_theme(app: QApplication):
 # ----------------- main -----------------
 def main():
     app = QApplication(sys.argv)
-    ensure_dark_theme(app)
 
-    # Ícono global de la app (Windows: preferir .ico para title bar)
-    ico_ico = Path(resource_path("assets/app.ico"))
-    ico_png = Path(resource_path("assets/app.png"))
-    if ico_ico.exists():
-        app.setWindowIcon(QIcon(str(ico_ico)))
-    elif ico_png.exists():
-        app.setWindowIcon(QIcon(str(ico_png)))
+    # Ícono global de la app: un único QIcon para app y ventana
+    app_qicon = _build_app_icon()
+    if app_qicon:
+        app.setWindowIcon(app_qicon)
 
-    ensure_projects_ini(INI_PATH)
+    # un solo stat decide si hay que escribir el INI por defecto y sirve de clave de caché
+    try:
+        st = os.stat(INI_PATH)
+    except FileNotFoundError:
+        ensure_projects_ini(INI_PATH)
+        st = os.stat(INI_PATH)
     try:
-        header_title, projects = load_projects_from_ini(INI_PATH)
+        header_title, projects = load_projects_from_ini(INI_PATH, st)
         if not projects:
             raise RuntimeError("projects.ini no contiene proyectos válidos (faltan 'exe=').")
     except Exception as e:
         QMessageBox.critical(None, "Error", f"No se pudo cargar {INI_PATH.name}:\n{e}")
         return 1
 
-    w = MainWindow(projects, header_title=header_title)
+    w = MainWindow(projects, header_title=header_title, app_icon=app_qicon)
     w.show()
+    # el QSS se aplica ya con la ventana pintada, no antes del primer frame
+    QTimer.singleShot(0, lambda: ensure_dark_theme(app))
     return app.exec()
 
 